@@ -1,8 +1,58 @@
 # app.py
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from extractor import extract_video_id, get_transcript
-from summazier import summarize_transcript_text
-from pytube import YouTube
+from summazier import AVAILABLE_MODELS, DEFAULT_MODEL, get_summarizer, summarize_transcript_text
+
+
+OEMBED_URL = "https://www.youtube.com/oembed"
+
+
+def fetch_metadata(url):
+    """Load display metadata via YouTube's oEmbed endpoint, returning (metadata, error message)."""
+    try:
+        response = requests.get(OEMBED_URL, params={"url": url, "format": "json"}, timeout=10)
+        response.raise_for_status()
+        oembed = response.json()
+        return {
+            "thumbnail_url": oembed["thumbnail_url"],
+            "title": oembed["title"],
+            "author": oembed["author_name"],
+        }, None
+    except Exception as exc:
+        return None, str(exc)
+
+
+class TranscriptUnavailable(Exception):
+    """Raised inside the cached lookup so failed fetches are not memoized."""
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_transcript(video_id):
+    """Fetch a transcript through Streamlit's data cache, raising if it is unavailable."""
+    transcript_payload, transcript_error = get_transcript(video_id)
+    if transcript_error:
+        raise TranscriptUnavailable(transcript_error)
+    return transcript_payload
+
+
+def load_transcript(video_id):
+    """Memoize transcript lookups across reruns and sessions, returning (payload, error)."""
+    try:
+        return _cached_transcript(video_id), None
+    except TranscriptUnavailable as exc:
+        return None, str(exc)
+
+
+@st.cache_resource(show_spinner=False)
+def load_summarizer(model_name=DEFAULT_MODEL):
+    """Load and warm up the Hugging Face pipeline once per process, shared across sessions."""
+    return get_summarizer(model_name)
+
 
 # Initialize
 if 'summarizer' not in st.session_state:
@@ -22,7 +72,18 @@ st.markdown("Get AI-powered summaries of any YouTube video in seconds!")
 # Sidebar for settings
 with st.sidebar:
     st.header("⚙️ Settings")
-    summary_length = st.slider("Summary Length", 100, 500, 250)
+    model_name = st.radio(
+        "Model",
+        AVAILABLE_MODELS,
+        help="DistilBART is faster; BART-large may give slightly richer summaries.",
+    )
+    summary_length = st.slider(
+        "Summary Length",
+        100,
+        500,
+        250,
+        help="Token budget for the final summary. Summaries already within about 1.5x of it are kept as they are.",
+    )
     show_timestamps = st.checkbox("Show Key Timestamps", value=True)
     
     st.markdown("---")
@@ -46,21 +107,18 @@ if st.button("🚀 Summarize", type="primary"):
             if not video_id:
                 st.error("Invalid YouTube URL")
             else:
-                # Get video metadata
-                metadata_error = None
-                yt_metadata = None
-
-                try:
-                    yt = YouTube(url_input)
-                    yt_metadata = {
-                        "thumbnail_url": yt.thumbnail_url,
-                        "title": yt.title,
-                        "author": yt.author,
-                        "length_minutes": yt.length // 60,
-                    }
-                except Exception as exc:
-                    metadata_error = str(exc)
-                    yt_metadata = None
+                # Metadata and transcript are independent network calls; fetch them together
+                # Workers inherit the script context so st.cache_data works off the main thread
+                executor = ThreadPoolExecutor(
+                    max_workers=2,
+                    initializer=add_script_run_ctx,
+                    initargs=(None, get_script_run_ctx()),
+                )
+                metadata_future = executor.submit(fetch_metadata, f"https://www.youtube.com/watch?v={video_id}")
+                transcript_future = executor.submit(load_transcript, video_id)
+                executor.shutdown(wait=False)
+
+                yt_metadata, metadata_error = metadata_future.result()
 
                 if metadata_error:
                     st.warning("Could not load some video details; continuing with transcript lookup.")
@@ -73,23 +131,38 @@ if st.button("🚀 Summarize", type="primary"):
 
                     with col2:
                         st.subheader(yt_metadata["title"])
-                        st.caption(f"👤 {yt_metadata['author']} | ⏱️ {yt_metadata['length_minutes']} min")
+                        st.caption(f"👤 {yt_metadata['author']}")
 
                     st.markdown("---")
 
                 # Get transcript
                 with st.status("Fetching transcript..."):
-                    transcript_payload, transcript_error = get_transcript(video_id)
+                    transcript_payload, transcript_error = transcript_future.result()
 
                 if transcript_error:
                     st.error(transcript_error)
                 elif transcript_payload:
                     transcript_text = transcript_payload.get('full_text', '')
-                    timestamps = transcript_payload.get('timestamped', [])
+                    timestamps = transcript_payload.get('timestamped')
 
                     # Generate summary
                     with st.status("Generating summary..."):
-                        summary = st.session_state.summarizer(transcript_text)
+                        load_summarizer(model_name)
+
+                        # Show chunk summaries as they finish instead of a silent wait
+                        partial_placeholder = st.empty()
+                        partial_summaries = []
+
+                        def show_partial(partial):
+                            partial_summaries.append(partial)
+                            partial_placeholder.markdown("\n\n".join(partial_summaries))
+
+                        summary = st.session_state.summarizer(
+                            transcript_text,
+                            model_name=model_name,
+                            on_partial=show_partial,
+                            summary_length=summary_length,
+                        )
 
                     # Display results
                     st.success("✅ Summary Generated!")
@@ -108,18 +181,19 @@ if st.button("🚀 Summarize", type="primary"):
                     )
 
                     # Timestamps section
-                    if show_timestamps and timestamps:
+                    if show_timestamps and timestamps and len(timestamps['start']):
                         st.markdown("---")
                         st.markdown("### ⏰ Key Timestamps")
 
                         # Sample every 10th timestamp for key moments
-                        key_moments = timestamps[::10][:10]
+                        key_starts = timestamps['start'][::10][:10]
+                        key_texts = timestamps['text'][::10][:10]
+                        key_minutes = (key_starts // 60).astype(np.int32)
+                        key_seconds = (key_starts % 60).astype(np.int32)
 
-                        for moment in key_moments:
-                            minutes = int(moment['time'] // 60)
-                            seconds = int(moment['time'] % 60)
+                        for minutes, seconds, text in zip(key_minutes, key_seconds, key_texts):
                             st.markdown(
-                                f"**[{minutes}:{seconds:02d}]** {moment['text']}"
+                                f"**[{minutes}:{seconds:02d}]** {text}"
                             )
 
                     # Full transcript (collapsible)
@@ -139,3 +213,6 @@ if st.button("🚀 Summarize", type="primary"):
 # Footer
 st.markdown("---")
 st.markdown("Made with ❤️ using Streamlit & Transformers")
+
+# Warm the model after the page has rendered so the first summary skips cold start
+load_summarizer(model_name)
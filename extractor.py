@@ -4,6 +4,21 @@ from youtube_transcript_api import TranscriptsDisabled, NoTranscriptFound
 import re
 from urllib.parse import urlparse, parse_qs
 
+import diskcache
+import numpy as np
+
+
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 60 * 60  # seconds; captions rarely change once published
+
+TRANSCRIPT_CACHE_VERSION = 4  # bump when the cached payload layout changes
+
+_TRANSCRIPT_CACHE = diskcache.Cache(".transcript_cache")
+
+_SHORT_LINK_HOSTS = frozenset({'youtu.be', 'www.youtu.be'})
+_ID_PATH_PREFIXES = frozenset({'embed', 'shorts'})
+_VIDEO_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 def extract_video_id(url):
     """Return a YouTube video ID parsed from supported URL formats."""
@@ -13,7 +28,7 @@ def extract_video_id(url):
     parsed = urlparse(url.strip())
     hostname = (parsed.hostname or '').lower()
 
-    if hostname in {'youtu.be', 'www.youtu.be'}:
+    if hostname in _SHORT_LINK_HOSTS:
         video_id = parsed.path.lstrip('/')
         return video_id or None
 
@@ -23,37 +38,49 @@ def extract_video_id(url):
         if parsed.path == '/watch':
             return parse_qs(parsed.query).get('v', [None])[0]
 
-        if len(path_parts) >= 2 and path_parts[0] in {'embed', 'shorts'}:
+        if len(path_parts) >= 2 and path_parts[0] in _ID_PATH_PREFIXES:
             return path_parts[1] or None
 
-    match = re.search(r'(?:v=|/)([0-9A-Za-z_-]{11})', url)
+    match = _VIDEO_ID_RE.search(url)
     if match:
         return match.group(1)
 
     return None
 
 def get_transcript(video_id):
-    """Fetch transcript data via YouTubeTranscriptApi.fetch and return raw snippets."""
+    """Return transcript data for a video, serving repeat lookups from the disk cache."""
     if not video_id:
         return None, "Error: missing video id"
 
+    cache_key = (TRANSCRIPT_CACHE_VERSION, video_id)
+    cached = _TRANSCRIPT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached, None
+
+    transcript_payload, transcript_error = _fetch_transcript(video_id)
+    if transcript_payload is not None:
+        _TRANSCRIPT_CACHE.set(cache_key, transcript_payload, expire=TRANSCRIPT_CACHE_TTL)
+    return transcript_payload, transcript_error
+
+
+def _fetch_transcript(video_id):
+    """Fetch transcript data via YouTubeTranscriptApi.fetch."""
     try:
         fetched_transcript = YouTubeTranscriptApi().fetch(video_id)
         raw_segments = fetched_transcript.to_raw_data()
 
-        full_text = " ".join(segment.get('text', '').strip() for segment in raw_segments).strip()
+        texts = [segment['text'] for segment in raw_segments if segment.get('text')]
+        # One whitespace pass also flattens the line breaks captions often contain
+        full_text = _WHITESPACE_RE.sub(' ', " ".join(texts)).strip()
 
-        timestamped_text = [
-            {
-                'time': segment.get('start', 0.0),
-                'duration': segment.get('duration', 0.0),
-                'text': segment.get('text', '').strip(),
-            }
-            for segment in raw_segments
-        ]
+        # Parallel arrays instead of one dict per caption segment
+        timestamped_text = {
+            'start': np.asarray([segment.get('start', 0.0) for segment in raw_segments], dtype=np.float32),
+            'duration': np.asarray([segment.get('duration', 0.0) for segment in raw_segments], dtype=np.float32),
+            'text': [segment.get('text', '').strip() for segment in raw_segments],
+        }
 
         return {
-            'segments': raw_segments,
             'full_text': full_text,
             'timestamped': timestamped_text,
             'language': getattr(fetched_transcript, 'language', None),
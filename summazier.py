@@ -1,73 +1,372 @@
+import copy
+import hashlib
+import logging
+import queue
 import re
-from typing import Dict, Iterable, List, Optional, Tuple
-
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain, islice
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import diskcache
 import torch
+import transformers
+from packaging.version import Version
 from transformers import pipeline
 
 from extractor import extract_video_id, get_transcript
 
 
-DEFAULT_MODEL = "facebook/bart-large-cnn"
+DEFAULT_MODEL = "sshleifer/distilbart-cnn-12-6"  # ~2x faster than BART with similar ROUGE
+AVAILABLE_MODELS = (DEFAULT_MODEL, "facebook/bart-large-cnn")
 MAX_INPUT_TOKENS = 880  # stay well below BART's 1024 token encoder limit
+INPUT_TOKEN_HEADROOM = 144  # margin kept below a model's encoder limit when chunking
+CHUNK_BATCH_SIZE = 8  # consecutive chunks summarised per forward pass
+FINAL_SUMMARY_MAX_TOKENS = 240  # default length budget for the summary-of-summaries pass
+REDUCE_SKIP_RATIO = 1.5  # partials within this multiple of the budget are returned as-is
+CPU_SUMMARY_WORKERS = 2  # pipeline instances summarising batches in parallel on CPU
+SUMMARY_CACHE_VERSION = 2  # bump when chunking or generation settings change
+ONNX_CACHE_DIR = Path(".onnx_models")  # exported + INT8-quantized models for CPU inference
+
+
+logger = logging.getLogger(__name__)
+
+_TRANSFORMERS_VERSION = Version(transformers.__version__)
+
+_DEFAULT_TORCH_THREADS = torch.get_num_threads()
+
+_PIPELINE_LOCK = threading.Lock()
+_POOL_GROWTH_LOCK = threading.Lock()
+_PIPELINE_POOL_CACHE: Dict[str, List[object]] = {}
+_IDLE_PIPELINES: Dict[str, "queue.Queue[object]"] = {}
+_THREADS_LOCK = threading.Lock()
+_PARALLEL_SECTIONS = 0
+_CHUNK_TOKENIZER_CACHE: Dict[str, object] = {}
+_ONNX_FAILED: Set[str] = set()
+_SUMMARY_CACHE = diskcache.Cache(".summary_cache")
+
+
+def _cpu_supports_bf16() -> bool:
+	"""Return True when the CPU has native BF16 support (AVX512-BF16 / AMX)."""
+	for name in ("_is_avx512_bf16_supported", "_is_cpu_support_avx512_bf16"):
+		check = getattr(torch.cpu, name, None) or getattr(getattr(torch._C, "_cpu", None), name, None)
+		if check is not None:
+			try:
+				return bool(check())
+			except Exception:
+				return False
+	return False
+
+
+def _select_dtype() -> torch.dtype:
+	"""Pick the smallest dtype the current hardware runs efficiently."""
+	if torch.cuda.is_available():
+		return torch.float16
+	if _cpu_supports_bf16():
+		return torch.bfloat16
+	return torch.float32
+
+
+def _warm_up(summarizer) -> None:
+	"""Run one throwaway generation so lazy init and kernel selection happen at load time."""
+	summarizer("warmup. " * 50, max_length=30, min_length=10, do_sample=False)
+
+
+def _compile_model(summarizer) -> bool:
+	"""Compile the model forward on CUDA, keeping eager mode if compilation fails.
+
+	Returns True when the compiled model has already been warmed up.
+	"""
+	if not torch.cuda.is_available() or not hasattr(torch, "compile"):
+		return False
+	eager_forward = summarizer.model.forward
+	try:
+		# mode="default" avoids CUDA graphs, which re-record as generate() grows the KV cache.
+		summarizer.model.forward = torch.compile(
+			eager_forward,
+			mode="default",
+			fullgraph=False,
+			dynamic=True,
+		)
+		# Compilation is lazy, so this call both warms up and surfaces any compile failure.
+		_warm_up(summarizer)
+		return True
+	except Exception:
+		summarizer.model.forward = eager_forward
+		return False
+
+
+def _load_onnx_summarizer(model_name: str):
+	"""Build an ONNX Runtime pipeline for CPU, or return None so callers fall back to PyTorch."""
+	try:
+		from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+		from optimum.onnxruntime.configuration import AutoQuantizationConfig
+		from transformers import AutoTokenizer
+	except ImportError:
+		return None
 
+	export_dir = ONNX_CACHE_DIR / model_name.replace("/", "--")
+	quantized_dir = export_dir / "int8"
+	# Written only after every file is quantized, so an interrupted export is redone.
+	complete_marker = quantized_dir / ".complete"
+	# Written when export or loading fails, so later runs go straight to PyTorch.
+	failed_marker = export_dir / ".failed"
+	if model_name in _ONNX_FAILED or failed_marker.exists():
+		return None
+	onnx_files = {
+		"encoder_file_name": "encoder_model",
+		"decoder_file_name": "decoder_model",
+		"decoder_with_past_file_name": "decoder_with_past_model",
+	}
 
-_PIPELINE_CACHE: Dict[str, object] = {}
+	try:
+		if not complete_marker.exists():
+			# Export and quantize once; later runs load straight from disk.
+			ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+				model_name,
+				export=True,
+				provider="CPUExecutionProvider",
+			)
+			ort_model.save_pretrained(export_dir)
+			quantization_config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+			for stem in onnx_files.values():
+				if not (export_dir / f"{stem}.onnx").exists():
+					continue
+				quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=f"{stem}.onnx")
+				quantizer.quantize(save_dir=quantized_dir, quantization_config=quantization_config)
+			complete_marker.touch()
+
+		file_names = {
+			key: f"{stem}_quantized.onnx"
+			for key, stem in onnx_files.items()
+			if (quantized_dir / f"{stem}_quantized.onnx").exists()
+		}
+		ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+			quantized_dir,
+			provider="CPUExecutionProvider",
+			**file_names,
+		)
+		tokenizer = AutoTokenizer.from_pretrained(model_name)
+		return pipeline("summarization", model=ort_model, tokenizer=tokenizer)
+	except (OSError, RuntimeError, ValueError) as exc:
+		# Export, quantization or loading failed; the PyTorch pipeline still works.
+		logger.warning(
+			"ONNX Runtime backend unavailable for %s, using PyTorch instead "
+			"(delete %s to retry): %s",
+			model_name,
+			failed_marker,
+			exc,
+			exc_info=True,
+		)
+		_ONNX_FAILED.add(model_name)
+		try:
+			export_dir.mkdir(parents=True, exist_ok=True)
+			failed_marker.write_text(f"{type(exc).__name__}: {exc}\n", encoding="utf-8")
+		except OSError:
+			pass
+		return None
 
 
-def _get_summarizer(model_name: str = DEFAULT_MODEL):
+def _load_torch_summarizer(model_name: str):
+	"""Build the PyTorch pipeline, preferring fused SDPA attention when available."""
+	device = 0 if torch.cuda.is_available() else -1
+	model_kwargs = {"torch_dtype": _select_dtype()}
+
+	if _TRANSFORMERS_VERSION >= Version("4.36"):
+		try:
+			return pipeline(
+				"summarization",
+				model=model_name,
+				tokenizer=model_name,
+				device=device,
+				model_kwargs={**model_kwargs, "attn_implementation": "sdpa"},
+			)
+		except (ValueError, ImportError):
+			# Not every architecture implements SDPA; fall back to eager attention.
+			pass
+
+	summarizer = pipeline(
+		"summarization",
+		model=model_name,
+		tokenizer=model_name,
+		device=device,
+		model_kwargs=model_kwargs,
+	)
+	if _TRANSFORMERS_VERSION < Version("4.36"):
+		try:
+			summarizer.model = summarizer.model.to_bettertransformer()
+		except (ValueError, ImportError, NotImplementedError):
+			pass
+	return summarizer
+
+
+def _build_summarizer(model_name: str):
+	"""Load and warm a new pipeline: ONNX Runtime on CPU when available, otherwise PyTorch."""
+	summarizer = None
+	if not torch.cuda.is_available():
+		summarizer = _load_onnx_summarizer(model_name)
+
+	if summarizer is None:
+		summarizer = _load_torch_summarizer(model_name)
+		if _compile_model(summarizer):
+			return summarizer
+	_warm_up(summarizer)
+	return summarizer
+
+
+def _get_summarizer_pool(model_name: str = DEFAULT_MODEL) -> List[object]:
+	"""Return the pipelines loaded for a model, building and warming the first on first use.
+
+	The pool starts with one pipeline on default threads. Extra CPU workers are
+	added by _grow_summarizer_pool only when a transcript is long enough to use them.
+	"""
+	with _PIPELINE_LOCK:
+		if model_name not in _PIPELINE_POOL_CACHE:
+			summarizer = _build_summarizer(model_name)
+			idle: "queue.Queue[object]" = queue.Queue()
+			idle.put(summarizer)
+			_CHUNK_TOKENIZER_CACHE[model_name] = copy.deepcopy(summarizer.tokenizer)
+			_IDLE_PIPELINES[model_name] = idle
+			_PIPELINE_POOL_CACHE[model_name] = [summarizer]
+		return _PIPELINE_POOL_CACHE[model_name]
+
+
+def _parallel_worker_count(model_name: str = DEFAULT_MODEL) -> int:
+	"""Return how many pipelines may summarise batches of this model concurrently.
+
+	Only the PyTorch CPU backend runs in parallel: on GPU one batched pipeline
+	keeps the device busy, and ONNX Runtime sessions have fixed thread pools
+	that _split_torch_threads cannot shrink.
+	"""
+	if torch.cuda.is_available() or CPU_SUMMARY_WORKERS <= 1:
+		return 1
+	if not isinstance(_get_summarizer_pool(model_name)[0].model, torch.nn.Module):
+		return 1
+	return CPU_SUMMARY_WORKERS
+
+
+def _grow_summarizer_pool(model_name: str = DEFAULT_MODEL) -> int:
+	"""Load the extra CPU workers the first time a transcript needs them."""
+	workers = _parallel_worker_count(model_name)
+	# A separate lock keeps other sessions borrowing the first pipeline while workers load.
+	with _POOL_GROWTH_LOCK:
+		pool = _get_summarizer_pool(model_name)
+		while len(pool) < workers:
+			summarizer = _build_summarizer(model_name)
+			with _PIPELINE_LOCK:
+				pool.append(summarizer)
+				_IDLE_PIPELINES[model_name].put(summarizer)
+		return len(pool)
+
+
+def get_summarizer(model_name: str = DEFAULT_MODEL):
 	"""Reuse the Hugging Face pipeline so we do not re-download on each call."""
-	if model_name not in _PIPELINE_CACHE:
-		device = 0 if torch.cuda.is_available() else -1
-		_PIPELINE_CACHE[model_name] = pipeline(
-			"summarization",
-			model=model_name,
-			tokenizer=model_name,
-			device=device,
-		)
-	return _PIPELINE_CACHE[model_name]
+	return _get_summarizer_pool(model_name)[0]
+
+
+@contextmanager
+def _borrow_summarizer(model_name: str = DEFAULT_MODEL) -> Iterator[object]:
+	"""Check a pipeline out of the model's pool so no two threads run the same one."""
+	_get_summarizer_pool(model_name)
+	idle = _IDLE_PIPELINES[model_name]
+	summarizer = idle.get()
+	try:
+		yield summarizer
+	finally:
+		idle.put(summarizer)
+
+
+def _worker_thread_count() -> int:
+	"""Intra-op threads each CPU worker may use without oversubscribing cores."""
+	return max(1, _DEFAULT_TORCH_THREADS // CPU_SUMMARY_WORKERS)
+
+
+@contextmanager
+def _split_torch_threads() -> Iterator[None]:
+	"""Share torch's process-wide intra-op threads between workers while they run.
+
+	torch.set_num_threads is global, so it is lowered only while at least one
+	parallel section is active and restored for everything else.
+	"""
+	global _PARALLEL_SECTIONS
+	with _THREADS_LOCK:
+		if _PARALLEL_SECTIONS == 0:
+			torch.set_num_threads(_worker_thread_count())
+		_PARALLEL_SECTIONS += 1
+	try:
+		yield
+	finally:
+		with _THREADS_LOCK:
+			_PARALLEL_SECTIONS -= 1
+			if _PARALLEL_SECTIONS == 0:
+				torch.set_num_threads(_DEFAULT_TORCH_THREADS)
+
+
+def _get_chunk_tokenizer(model_name: str = DEFAULT_MODEL):
+	"""Return a tokenizer copy reserved for chunking on the producer thread.
+
+	The pipeline tokenizer reconfigures truncation on every call, and a fast
+	tokenizer cannot be used from two threads while that happens.
+	"""
+	_get_summarizer_pool(model_name)
+	return _CHUNK_TOKENIZER_CACHE[model_name]
+
+
+def _max_input_tokens(tokenizer) -> int:
+	"""Derive the chunk token budget from the model's encoder limit."""
+	limit = getattr(tokenizer, "model_max_length", None)
+	# Tokenizers without a configured limit report a huge sentinel value.
+	if not limit or limit > 100_000:
+		return MAX_INPUT_TOKENS
+	return max(limit - INPUT_TOKEN_HEADROOM, 1)
 
 
 def _chunk_text(
 	text: str,
 	tokenizer,
 	max_tokens: int = MAX_INPUT_TOKENS,
-) -> Iterable[str]:
-	"""Split transcript into sentence-aware chunks under the token budget."""
+) -> Iterator[str]:
+	"""Lazily yield sentence-aware chunks under the token budget."""
 	if not text:
-		return []
-
-	sentences = re.split(r"(?<=[.!?])\s+", text)
-	chunks: List[str] = []
+		return
+
+	sentences = [
+		sentence.strip()
+		for sentence in re.split(r"(?<=[.!?])\s+", text)
+		if sentence.strip()
+	]
+	if not sentences:
+		return
+
+	# Encode every sentence in one call so the fast tokenizer batches the work.
+	sentence_ids = tokenizer(sentences, add_special_tokens=False)["input_ids"]
 	current: List[str] = []
 	current_tokens = 0
 
-	for sentence in sentences:
-		sentence = sentence.strip()
-		if not sentence:
-			continue
-
-		token_count = len(tokenizer.encode(sentence, add_special_tokens=False))
-
+	for sentence, token_count in zip(sentences, map(len, sentence_ids)):
 		if token_count > max_tokens:
 			# Sentence alone is too large; break it hard to avoid failures.
 			words = sentence.split()
+			word_ids = tokenizer(words, add_special_tokens=False)["input_ids"]
 			temp_chunk: List[str] = []
 			temp_tokens = 0
-			for word in words:
-				word_tokens = len(tokenizer.encode(word, add_special_tokens=False))
+			for word, word_tokens in zip(words, map(len, word_ids)):
 				if temp_chunk and temp_tokens + word_tokens > max_tokens:
-					chunks.append(" ".join(temp_chunk))
+					yield " ".join(temp_chunk)
 					temp_chunk = [word]
 					temp_tokens = word_tokens
 				else:
 					temp_chunk.append(word)
 					temp_tokens += word_tokens
 			if temp_chunk:
-				chunks.append(" ".join(temp_chunk))
+				yield " ".join(temp_chunk)
 			continue
 
 		if current and current_tokens + token_count > max_tokens:
-			chunks.append(" ".join(current))
+			yield " ".join(current)
 			current = [sentence]
 			current_tokens = token_count
 		else:
@@ -75,43 +374,219 @@ def _chunk_text(
 			current_tokens += token_count
 
 	if current:
-		chunks.append(" ".join(current))
+		yield " ".join(current)
+
+
+def _summarize_chunk_fallback(summarizer, chunk: str) -> List[str]:
+	"""Summarise a single chunk, splitting it in half if the model rejects it."""
+	try:
+		result = summarizer(chunk, max_length=220, min_length=60, do_sample=False)
+		return [result[0]["summary_text"].strip()]
+	except IndexError:
+		# Rare case: token estimate was off; break the chunk in half and retry.
+		words = chunk.split()
+		if len(words) < 2:
+			raise
+		midpoint = len(words) // 2
+		sub_chunks = [" ".join(words[:midpoint]), " ".join(words[midpoint:])]
+		summaries: List[str] = []
+		for sub_chunk in sub_chunks:
+			if not sub_chunk.strip():
+				continue
+			result = summarizer(sub_chunk, max_length=200, min_length=40, do_sample=False)
+			summaries.append(result[0]["summary_text"].strip())
+		return summaries
+
+
+def _prefetch(items: Iterable[str], maxsize: int = 2) -> Iterator[str]:
+	"""Iterate ``items`` on a background thread, handing them over through a bounded queue."""
+	buffer: "queue.Queue[object]" = queue.Queue(maxsize=maxsize)
+	stop = threading.Event()
+	done = object()
+	errors: List[BaseException] = []
+
+	def put(item: object) -> bool:
+		# Poll so the producer notices when the consumer has gone away.
+		while not stop.is_set():
+			try:
+				buffer.put(item, timeout=0.1)
+				return True
+			except queue.Full:
+				continue
+		return False
+
+	def produce() -> None:
+		try:
+			for item in items:
+				if not put(item):
+					return
+		except BaseException as exc:
+			errors.append(exc)
+		finally:
+			put(done)
+
+	threading.Thread(target=produce, daemon=True).start()
+	try:
+		while True:
+			item = buffer.get()
+			if item is done:
+				break
+			yield item
+	finally:
+		# Runs on normal exit, on errors downstream, and when the generator is closed.
+		stop.set()
+	if errors:
+		raise errors[0]
+
+
+def _summarize_batch(summarizer, batch: List[str]) -> List[str]:
+	"""Summarise one batch of chunks in a single pipeline call."""
+	try:
+		results = summarizer(
+			batch,
+			max_length=220,
+			min_length=60,
+			do_sample=False,
+			batch_size=len(batch),
+		)
+	except IndexError:
+		# Retry this batch one chunk at a time so only the offending chunk gets split.
+		return [summary for chunk in batch for summary in _summarize_chunk_fallback(summarizer, chunk)]
+	return [result["summary_text"].strip() for result in results]
+
+
+def _batched(items: Iterator[str], size: int) -> Iterator[List[str]]:
+	"""Group an iterator into lists of at most ``size`` items."""
+	while True:
+		batch = list(islice(items, size))
+		if not batch:
+			return
+		yield batch
+
+
+def _summarize_chunks(
+	model_name: str,
+	chunks: Iterable[str],
+	batch_size: int = CHUNK_BATCH_SIZE,
+) -> Iterator[str]:
+	"""Summarise chunks in batches as they arrive, yielding summaries in input order.
+
+	When there are enough batches to occupy several CPU workers, batches run
+	concurrently, one pipeline per batch.
+	"""
+	workers = _parallel_worker_count(model_name)
+	batches = _batched(iter(chunks), batch_size)
+	# Read ahead just far enough to know whether every worker would get a batch.
+	head = list(islice(batches, workers))
+
+	if len(head) < workers or workers == 1:
+		for batch in chain(head, batches):
+			with _borrow_summarizer(model_name) as summarizer:
+				summaries = _summarize_batch(summarizer, batch)
+			yield from summaries
+		return
+
+	workers = _grow_summarizer_pool(model_name)
+
+	def run(batch: List[str]) -> List[str]:
+		with _borrow_summarizer(model_name) as summarizer:
+			return _summarize_batch(summarizer, batch)
+
+	with _split_torch_threads(), ThreadPoolExecutor(max_workers=workers) as executor:
+		pending: Deque[Future] = deque()
+		for batch in chain(head, batches):
+			pending.append(executor.submit(run, batch))
+			if len(pending) >= workers:
+				yield from pending.popleft().result()
+		while pending:
+			yield from pending.popleft().result()
+
+
+def _transcript_digest(full_text: str) -> str:
+	"""Hash transcript text for use in summary cache keys."""
+	return hashlib.blake2b(full_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def summarize_transcript_text(
+	full_text: str,
+	model_name: str = DEFAULT_MODEL,
+	on_partial: Optional[Callable[[str], None]] = None,
+	summary_length: int = FINAL_SUMMARY_MAX_TOKENS,
+) -> Optional[str]:
+	"""Generate a concise summary from transcript text, reusing cached results.
+
+	``on_partial`` is called with each chunk summary as soon as it is ready, so
+	callers can show progress before the final summary is produced.
+	``summary_length`` is the token budget for the final summary; it only
+	affects the reduce step, so changing it reuses cached chunk summaries.
+	"""
+	if not full_text:
+		return None
 
-	return chunks
+	# Generation is deterministic (do_sample=False), so cached results are exact.
+	digest = _transcript_digest(full_text)
+	summary_key = (SUMMARY_CACHE_VERSION, "summary", digest, model_name, summary_length)
+	cached = _SUMMARY_CACHE.get(summary_key)
+	if cached is not None:
+		return cached
+
+	partials_key = (SUMMARY_CACHE_VERSION, "partials", digest, model_name)
+	partial_summaries = _SUMMARY_CACHE.get(partials_key)
+	if partial_summaries is None:
+		partial_summaries = _summarize_partials(full_text, model_name, on_partial)
+		if partial_summaries:
+			_SUMMARY_CACHE.set(partials_key, partial_summaries)
+	elif on_partial is not None:
+		for partial in partial_summaries:
+			on_partial(partial)
+
+	if not partial_summaries:
+		return None
 
+	summary = _reduce_partials(partial_summaries, model_name, summary_length)
+	if summary:
+		_SUMMARY_CACHE.set(summary_key, summary)
+	return summary
 
-def summarize_transcript_text(full_text: str, model_name: str = DEFAULT_MODEL) -> Optional[str]:
-	"""Generate a concise summary from transcript text."""
-	summarizer = _get_summarizer(model_name)
-	tokenizer = summarizer.tokenizer
 
-	chunks = list(_chunk_text(full_text, tokenizer))
-	if not chunks:
-		return None
+def _summarize_partials(
+	full_text: str,
+	model_name: str,
+	on_partial: Optional[Callable[[str], None]] = None,
+) -> List[str]:
+	"""Run the map step: summarise every transcript chunk, in order."""
+	# Chunking runs on a background thread while the model summarises earlier chunks.
+	tokenizer = _get_chunk_tokenizer(model_name)
+	chunks = _prefetch(_chunk_text(full_text, tokenizer, _max_input_tokens(tokenizer)))
 
 	partial_summaries: List[str] = []
-	for chunk in chunks:
-		try:
-			result = summarizer(chunk, max_length=220, min_length=60, do_sample=False)
-			partial_summaries.append(result[0]["summary_text"].strip())
-		except IndexError:
-			# Rare case: token estimate was off; break the chunk in half and retry.
-			words = chunk.split()
-			if len(words) < 2:
-				raise
-			midpoint = len(words) // 2
-			sub_chunks = [" ".join(words[:midpoint]), " ".join(words[midpoint:])]
-			for sub_chunk in sub_chunks:
-				if not sub_chunk.strip():
-					continue
-				result = summarizer(sub_chunk, max_length=200, min_length=40, do_sample=False)
-				partial_summaries.append(result[0]["summary_text"].strip())
-
-	if len(partial_summaries) == 1:
-		return partial_summaries[0]
-
+	try:
+		for partial in _summarize_chunks(model_name, chunks):
+			partial_summaries.append(partial)
+			if on_partial is not None:
+				on_partial(partial)
+	finally:
+		# Stop the chunker thread promptly if summarisation failed part-way.
+		chunks.close()
+	return partial_summaries
+
+
+def _reduce_partials(partial_summaries: List[str], model_name: str, summary_length: int) -> str:
+	"""Run the reduce step, condensing the partial summaries to ``summary_length`` tokens."""
 	combined = " ".join(partial_summaries)
-	final_result = summarizer(combined, max_length=240, min_length=80, do_sample=False)
+	with _borrow_summarizer(model_name) as summarizer:
+		# The reduce pass costs a full forward; skip it when the partials are already short enough.
+		combined_tokens = len(summarizer.tokenizer(combined, add_special_tokens=False)["input_ids"])
+		if combined_tokens <= summary_length * REDUCE_SKIP_RATIO:
+			return combined
+
+		final_result = summarizer(
+			combined,
+			max_length=summary_length,
+			min_length=min(80, summary_length // 2),
+			do_sample=False,
+			truncation=True,
+		)
 	return final_result[0]["summary_text"].strip()
 
 